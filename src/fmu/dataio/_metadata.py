@@ -25,6 +25,9 @@ if TYPE_CHECKING:
 
 logger: Final = null_logger(__name__)
 
+# Validated once, as building a TypeAdapter is costly compared to using it
+SCHEMA_URL: Final = TypeAdapter(AnyHttpUrl).validate_strings(SCHEMA)
+
 
 def _get_meta_filedata(
     dataio: ExportData,
@@ -107,7 +110,7 @@ def generate_export_metadata(
     objdata = objectdata_provider_factory(obj, dataio)
 
     return schema.InternalObjectMetadata(
-        schema_=TypeAdapter(AnyHttpUrl).validate_strings(SCHEMA),  # type: ignore[call-arg]
+        schema_=SCHEMA_URL,  # type: ignore[call-arg]
         version=VERSION,
         source=SOURCE,
         class_=objdata.classname,
@@ -117,7 +120,7 @@ def generate_export_metadata(
             if isinstance(dataio.config, GlobalConfiguration)
             else None
         ),
-        access=_get_meta_access(dataio),
+        access=dataio._access,
         data=objdata.get_metadata(),
         file=_get_meta_filedata(dataio, obj, objdata, fmudata, compute_md5),
         tracklog=fields.Tracklog.initialize(),
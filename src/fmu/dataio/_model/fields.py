@@ -24,8 +24,10 @@ from pydantic import (
     GetJsonSchemaHandler,
     NaiveDatetime,
     RootModel,
+    field_validator,
     model_validator,
 )
+from typing_extensions import Annotated
 
 from fmu.dataio.version import __version__
 
@@ -34,6 +36,9 @@ from . import enums, fields
 if TYPE_CHECKING:
     from pydantic_core import CoreSchema
 
+UUIDField = Annotated[UUID, Field(examples=["15ce3b84-766f-4c93-9050-b154861f9100"])]
+"""A UUID with the example shown in the schema, shared by the uuid fields."""
+
 
 class Asset(BaseModel):
     """The ``access.asset`` block contains information about the owner asset of
@@ -115,14 +120,14 @@ class File(BaseModel):
     absolute_path_symlink: Optional[Path] = Field(default=None)
     """The path to a symlink of the absolute path."""
 
-    @model_validator(mode="before")
+    @field_validator("absolute_path")
     @classmethod
-    def _check_for_non_ascii_in_path(cls, values: Dict) -> Dict:
-        if (path := values.get("absolute_path")) and not str(path).isascii():
+    def _check_for_non_ascii_in_path(cls, path: Optional[Path]) -> Optional[Path]:
+        if path and not str(path).isascii():
             raise ValueError(
                 f"Path has non-ascii elements which is not supported: {path}"
             )
-        return values
+        return path
 
 
 class Parameters(RootModel):
@@ -132,7 +137,7 @@ class Parameters(RootModel):
     parameters.
     """
 
-    root: Dict[str, Union[Parameters, int, float, str]]
+    root: Dict[str, Union[int, float, str, Parameters]]
     """A dictionary representing parameters as-is from parameters.txt."""
 
     def __iter__(self) -> Any:
@@ -140,7 +145,7 @@ class Parameters(RootModel):
         # resolving the correct type
         return iter(self.root)
 
-    def __getitem__(self, item: str) -> Union[Parameters, int, float, str]:
+    def __getitem__(self, item: str) -> Union[int, float, str, Parameters]:
         return self.root[item]
 
 
@@ -150,7 +155,7 @@ class Aggregation(BaseModel):
     performed over an ensemble.
     """
 
-    id: UUID = Field(examples=["15ce3b84-766f-4c93-9050-b154861f9100"])
+    id: UUIDField
     """The unique identifier of an aggregation."""
 
     operation: str
@@ -204,7 +209,7 @@ class Case(BaseModel):
     """A block holding information about the user.
     See :class:`User`."""
 
-    uuid: UUID = Field(examples=["15ce3b84-766f-4c93-9050-b154861f9100"])
+    uuid: UUIDField
     """The unique identifier of this case. Currently made by fmu.dataio."""
 
     description: Optional[List[str]] = Field(default=None)
@@ -241,7 +246,7 @@ class Iteration(BaseModel):
     """The name of the iteration. This is typically reflecting the folder name on
     scratch. In ERT, custom names for iterations are supported, e.g. "pred"."""
 
-    uuid: UUID = Field(examples=["15ce3b84-766f-4c93-9050-b154861f9100"])
+    uuid: UUIDField
     """The unique identifier of this case. Currently made by fmu.dataio."""
 
     restart_from: Optional[UUID] = Field(
@@ -294,7 +299,7 @@ class Realization(BaseModel):
     jobs: Optional[object] = Field(default=None)
     """Content directly taken from the ERT jobs.json file for this realization."""
 
-    uuid: UUID = Field(examples=["15ce3b84-766f-4c93-9050-b154861f9100"])
+    uuid: UUIDField
     """The universally unique identifier for this realization. It is a hash of
     ``fmu.case.uuid`` and ``fmu.iteration.uuid`` and ``fmu.realization.id``."""
 
@@ -306,7 +311,7 @@ class CountryItem(BaseModel):
     identifier: str = Field(examples=["Norway"])
     """Identifier known to SMDA."""
 
-    uuid: UUID = Field(examples=["15ce3b84-766f-4c93-9050-b154861f9100"])
+    uuid: UUIDField
     """Identifier known to SMDA."""
 
 
@@ -317,7 +322,7 @@ class DiscoveryItem(BaseModel):
     short_identifier: str = Field(examples=["SomeDiscovery"])
     """Identifier known to SMDA."""
 
-    uuid: UUID = Field(examples=["15ce3b84-766f-4c93-9050-b154861f9100"])
+    uuid: UUIDField
     """Identifier known to SMDA."""
 
 
@@ -328,7 +333,7 @@ class FieldItem(BaseModel):
     identifier: str = Field(examples=["OseFax"])
     """Identifier known to SMDA."""
 
-    uuid: UUID = Field(examples=["15ce3b84-766f-4c93-9050-b154861f9100"])
+    uuid: UUIDField
     """Identifier known to SMDA."""
 
 
@@ -339,7 +344,7 @@ class CoordinateSystem(BaseModel):
     identifier: str = Field(examples=["ST_WGS84_UTM37N_P32637"])
     """Identifier known to SMDA."""
 
-    uuid: UUID = Field(examples=["15ce3b84-766f-4c93-9050-b154861f9100"])
+    uuid: UUIDField
     """Identifier known to SMDA."""
 
 
@@ -350,7 +355,7 @@ class StratigraphicColumn(BaseModel):
     identifier: str = Field(examples=["DROGON_2020"])
     """Identifier known to SMDA."""
 
-    uuid: UUID = Field(examples=["15ce3b84-766f-4c93-9050-b154861f9100"])
+    uuid: UUIDField
     """Identifier known to SMDA."""
 
 
@@ -667,16 +672,14 @@ class FMU(FMUBase):
     """The ``fmu.ert`` block contains information about the current ert run
     See :class:`Ert`."""
 
-    @model_validator(mode="before")
-    @classmethod
-    def _dependencies_aggregation_realization(cls, values: Dict) -> Dict:
-        aggregation, realization = values.get("aggregation"), values.get("realization")
-        if aggregation and realization:
+    @model_validator(mode="after")
+    def _dependencies_aggregation_realization(self) -> FMU:
+        if self.aggregation and self.realization:
             raise ValueError(
                 "Both 'aggregation' and 'realization' cannot be set "
                 "at the same time. Please set only one."
             )
-        return values
+        return self
 
     @classmethod
     def __get_pydantic_json_schema__(
@@ -695,3 +698,9 @@ class FMU(FMUBase):
             }
         )
         return json_schema
+
+
+# Models with forward references to models defined later in this module are not
+# complete at class creation. Rebuild them now rather than lazily on first use.
+Ert.model_rebuild()
+Tracklog.model_rebuild()
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-from collections import ChainMap
-from typing import TYPE_CHECKING, Dict, List, Literal, TypeVar, Union
+from copy import deepcopy
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, Final, List, Literal, TypeVar, Union
 
 from pydantic import (
     BaseModel,
@@ -32,6 +33,9 @@ if TYPE_CHECKING:
 
 T = TypeVar("T", Dict, List, object)
 
+# Object classes whose 'data' block must contain the 'spec' field
+_CLASSES_REQUIRING_SPEC: Final = frozenset({FMUClass.table, FMUClass.surface})
+
 
 class MetadataBase(BaseModel):
     """Base model for all root metadata models generated."""
@@ -167,8 +171,8 @@ class Root(
     @model_validator(mode="after")
     def _check_class_data_spec(self) -> Root:
         if (
-            self.root.class_ in (FMUClass.table, FMUClass.surface)
-            and hasattr(self.root, "data")
+            self.root.class_ in _CLASSES_REQUIRING_SPEC
+            and isinstance(self.root, ObjectMetadata)
             and self.root.data.root.spec is None
         ):
             raise ValueError(
@@ -213,17 +217,19 @@ def _remove_format_path(obj: T) -> T:
     adjustment is necessary because JSON Schema does not recognize the "format":
     "path", while OpenAPI does. This function is used in contexts where OpenAPI
     specifications are not applicable.
-    """
 
-    if isinstance(obj, dict):
-        return {
-            k: _remove_format_path(v)
-            for k, v in obj.items()
-            if not (k == "format" and v == "path")
-        }
+    The object is modified in place, walking it with a stack instead of recursion.
+    """
 
-    if isinstance(obj, list):
-        return [_remove_format_path(element) for element in obj]
+    stack: list[object] = [obj]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            if node.get("format") == "path":
+                del node["format"]
+            stack.extend(node.values())
+        elif isinstance(node, list):
+            stack.extend(node)
 
     return obj
 
@@ -231,7 +237,8 @@ def _remove_format_path(obj: T) -> T:
 def dump() -> dict:
     """
     Dumps the export root model to JSON format for schema validation and
-    usage in FMU data structures.
+    usage in FMU data structures. The schema is generated once, and a copy
+    of it is returned.
 
     To update the schema:
         1. Run the following CLI command to dump the updated schema:
@@ -244,56 +251,58 @@ def dump() -> dict:
             If changes are satisfactory and do not introduce issues, commit
             them to maintain schema consistency.
     """
-    schema = dict(
-        ChainMap(
-            {
-                "$contractual": [
-                    "access",
-                    "class",
-                    "data.alias",
-                    "data.bbox",
-                    "data.content",
-                    "data.format",
-                    "data.grid_model",
-                    "data.is_observation",
-                    "data.is_prediction",
-                    "data.name",
-                    "data.offset",
-                    "data.seismic.attribute",
-                    "data.spec.columns",
-                    "data.stratigraphic",
-                    "data.stratigraphic_alias",
-                    "data.tagname",
-                    "data.time",
-                    "data.vertical_domain",
-                    "file.checksum_md5",
-                    "file.relative_path",
-                    "file.size_bytes",
-                    "fmu.aggregation.operation",
-                    "fmu.aggregation.realization_ids",
-                    "fmu.case",
-                    "fmu.context.stage",
-                    "fmu.iteration.name",
-                    "fmu.iteration.uuid",
-                    "fmu.model",
-                    "fmu.realization.id",
-                    "fmu.realization.name",
-                    "fmu.realization.uuid",
-                    "fmu.workflow",
-                    "masterdata",
-                    "source",
-                    "tracklog.datetime",
-                    "tracklog.event",
-                    "tracklog.user.id",
-                    "version",
-                ],
-                # schema must be present for "dependencies" key to work.
-                "$schema": "https://json-schema.org/draft/2020-12/schema",
-                "$id": "fmu_results.json",
-            },
-            Root.model_json_schema(),
-        )
-    )
+    return deepcopy(_generate_schema())
+
+
+@lru_cache(maxsize=1)
+def _generate_schema() -> dict:
+    """Generate the JSON schema for the export root model, see dump()."""
+    schema = {
+        **Root.model_json_schema(),
+        "$contractual": [
+            "access",
+            "class",
+            "data.alias",
+            "data.bbox",
+            "data.content",
+            "data.format",
+            "data.grid_model",
+            "data.is_observation",
+            "data.is_prediction",
+            "data.name",
+            "data.offset",
+            "data.seismic.attribute",
+            "data.spec.columns",
+            "data.stratigraphic",
+            "data.stratigraphic_alias",
+            "data.tagname",
+            "data.time",
+            "data.vertical_domain",
+            "file.checksum_md5",
+            "file.relative_path",
+            "file.size_bytes",
+            "fmu.aggregation.operation",
+            "fmu.aggregation.realization_ids",
+            "fmu.case",
+            "fmu.context.stage",
+            "fmu.iteration.name",
+            "fmu.iteration.uuid",
+            "fmu.model",
+            "fmu.realization.id",
+            "fmu.realization.name",
+            "fmu.realization.uuid",
+            "fmu.workflow",
+            "masterdata",
+            "source",
+            "tracklog.datetime",
+            "tracklog.event",
+            "tracklog.user.id",
+            "version",
+        ],
+        # schema must be present for "dependencies" key to work.
+        "$schema": "https://json-schema.org/draft/2020-12/schema",
+        "$id": "fmu_results.json",
+    }
 
     return _remove_format_path(
         _remove_discriminator_mapping(
@@ -10,7 +10,7 @@ from __future__ import annotations
 
 import warnings
 from textwrap import dedent
-from typing import List, Literal, Optional, Union
+from typing import Final, List, Literal, Optional, Union
 
 from pydantic import (
     AnyHttpUrl,
@@ -70,6 +70,13 @@ class ContentRequireSpecific(BaseModel):
     seismic: Optional[AllowedContentSeismic] = Field(default=None)
 
 
+# Contents requiring additional input, resolved once rather than per validation
+CONTENTS_REQUIRE_SPECIFIC: Final = frozenset(ContentRequireSpecific.model_fields)
+
+# Listed in the warning emitted for every export without content, hence joined once
+VALID_CONTENTS: Final = ", ".join(m.value for m in enums.Content)
+
+
 class AllowedContent(BaseModel):
     content: Union[enums.Content, Literal["unset"]]
     content_incl_specific: Optional[ContentRequireSpecific] = Field(default=None)
@@ -80,7 +87,7 @@ class AllowedContent(BaseModel):
         content = values.get("content")
         content_specific = values.get("content_incl_specific", {}).get(content)
 
-        if content in ContentRequireSpecific.model_fields and not content_specific:
+        if content in CONTENTS_REQUIRE_SPECIFIC and not content_specific:
             # 'property' should be included below after a deprecation period
             if content == enums.Content.property:
                 property_warn()
@@ -118,11 +125,10 @@ class InternalUnsetData(data.Data):
 
     @model_validator(mode="after")
     def _deprecation_warning(self) -> InternalUnsetData:
-        valid_contents = [m.value for m in enums.Content]
         warnings.warn(
             "The <content> is not provided which will produce invalid metadata. "
             "In the future 'content' will be required explicitly! "
-            f"\n\nValid contents are: {', '.join(valid_contents)} "
+            f"\n\nValid contents are: {VALID_CONTENTS} "
             "\n\nThis list can be extended upon request and need.",
             FutureWarning,
         )
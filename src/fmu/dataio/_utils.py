@@ -7,6 +7,7 @@ import hashlib
 import json
 import os
 import uuid
+from functools import lru_cache
 from pathlib import Path
 from tempfile import NamedTemporaryFile
 from typing import Any, Final, Literal
@@ -24,6 +25,13 @@ from .readers import FaultRoomSurface
 
 logger: Final = null_logger(__name__)
 
+# Read files in large blocks when hashing, to limit the number of python level calls
+MD5_BLOCKSIZE: Final = 2**20
+
+# Prefer the libyaml based loader and dumper when available, as they are far faster
+YamlSafeLoader: Final = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+YamlSafeDumper: Final = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 
 def npfloat_to_float(v: Any) -> Any:
     return float(v) if isinstance(v, (np.float64, np.float32)) else v
@@ -63,11 +71,12 @@ def export_metadata_file(
 
     if savefmt == "yaml":
         with open(file, "w", encoding="utf8") as stream:
-            stream.write(
-                yaml.safe_dump(
-                    metadata,
-                    allow_unicode=True,
-                )
+            yaml.dump(
+                metadata,
+                stream,
+                Dumper=YamlSafeDumper,
+                allow_unicode=True,
+                sort_keys=False,
             )
     else:
         with open(file.replace(file.with_suffix(".json")), "w") as stream:
@@ -148,7 +157,7 @@ def md5sum(fname: Path) -> str:
     """Calculate the MD5 checksum of a file."""
     hash_md5 = hashlib.md5()
     with open(fname, "rb") as fil:
-        for chunk in iter(lambda: fil.read(4096), b""):
+        for chunk in iter(lambda: fil.read(MD5_BLOCKSIZE), b""):
             hash_md5.update(chunk)
     return hash_md5.hexdigest()
 
@@ -200,6 +209,7 @@ def size(fname: str) -> int:
     return Path(fname).stat().st_size
 
 
+@lru_cache(maxsize=4096)
 def uuid_from_string(string: str) -> uuid.UUID:
     """Produce valid and repeteable UUID4 as a hash of given string"""
     return uuid.UUID(hashlib.md5(string.encode("utf-8")).hexdigest())
@@ -323,6 +333,25 @@ def get_object_name(obj: Path) -> str | None:
     return name
 
 
+@lru_cache(maxsize=256)
+def _yaml_load_file(filename: str, mtime_ns: int, size: int) -> Any:
+    """Load a yaml file, cached on the filename, modification time and size."""
+    logger.debug("Loading yaml file %s", filename)
+    with open(filename, encoding="utf-8") as stream:
+        return yaml.load(stream, Loader=YamlSafeLoader)
+
+
+def yaml_load_cached(filename: str | Path) -> Any:
+    """Load a yaml file, re-using the result from earlier reads if unmodified.
+
+    The returned object is shared between calls. Callers that modify it, or hand it
+    on to code that may, must take a copy first.
+    """
+    fname = os.fspath(filename)
+    stat = os.stat(fname)
+    return _yaml_load_file(fname, stat.st_mtime_ns, stat.st_size)
+
+
 def prettyprint_dict(inp: dict) -> str:
     """Prettyprint a dict into as string variable (for python logging e.g)"""
     return str(json.dumps(inp, indent=2, default=str, ensure_ascii=False))
@@ -376,18 +405,18 @@ def read_metadata_from_file(filename: str | Path) -> dict:
         filename: The full path filename to the data-object.
 
     Returns:
-        A dictionary with metadata read from the assiated metadata file.
+        A dictionary with metadata read from the assiated metadata file. The
+        dictionary is shared between calls, callers must copy it before modifying.
     """
-    fname = Path(filename)
-    if fname.stem.startswith("."):
-        raise OSError(f"The input is a hidden file, cannot continue: {fname.stem}")
-
-    metafile = str(fname.parent) + "/." + fname.stem + fname.suffix + ".yml"
-    metafilepath = Path(metafile)
-    if not metafilepath.exists():
-        raise OSError(f"Cannot find requested metafile: {metafile}")
-    with open(metafilepath) as stream:
-        return yaml.safe_load(stream)
+    dirname, basename = os.path.split(os.fspath(filename))
+    if basename.startswith("."):
+        raise OSError(f"The input is a hidden file, cannot continue: {basename}")
+
+    metafile = os.path.join(dirname, f".{basename}.yml")
+    try:
+        return yaml_load_cached(metafile)
+    except FileNotFoundError:
+        raise OSError(f"Cannot find requested metafile: {metafile}") from None
 
 
 def get_geometry_ref(
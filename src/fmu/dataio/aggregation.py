@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import copy
 import warnings
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -85,6 +84,10 @@ class AggregatedData:
 
     def _update_settings(self, newsettings: dict) -> None:
         """Update instance settings (properties) from other routines."""
+        # if no newsettings (kwargs) this routine is not needed
+        if not newsettings:
+            return
+
         logger.info("Try new settings %s", newsettings)
 
         # derive legal input from dataclass signature
@@ -168,11 +171,11 @@ class AggregatedData:
                 )
             abspath = str(casepath / relpath)
 
-        relpath = relpath.replace(realiname + "/", "")
-        relpath = Path(relpath)
+        # remove the realization folder, e.g. 'realization-33/', from the paths
+        realifolder = f"{realiname}/"
+        relpath = Path(relpath.replace(realifolder, ""))
         if abspath:
-            abspath = abspath.replace(realiname + "/", "")
-            abspath = Path(abspath)
+            abspath = Path(abspath.replace(realifolder, ""))
 
         suffix = relpath.suffix
         stem = relpath.stem
@@ -219,18 +222,24 @@ class AggregatedData:
         if not self.operation:
             raise ValueError("The 'operation' key has no value")
 
-        # use first as template
-        template = copy.deepcopy(self.source_metadata[0])
+        # use first as template, only copying the parts that are modified below
+        source = self.source_metadata[0]
+        template = {
+            **source,
+            "fmu": {**source["fmu"], "context": dict(source["fmu"]["context"])},
+            "data": dict(source["data"]),
+        }
 
         relpath, abspath = self._construct_filename(template)
 
         # fmu.realization shall not be used
         del template["fmu"]["realization"]
 
-        template["fmu"]["aggregation"] = {}
-        template["fmu"]["aggregation"]["operation"] = self.operation
-        template["fmu"]["aggregation"]["realization_ids"] = real_ids
-        template["fmu"]["aggregation"]["id"] = self.aggregation_id
+        template["fmu"]["aggregation"] = {
+            "operation": self.operation,
+            "realization_ids": real_ids,
+            "id": self.aggregation_id,
+        }
 
         # fmu.context.stage should be 'iteration'
         template["fmu"]["context"]["stage"] = FMUContext.iteration.value
@@ -320,18 +329,15 @@ class AggregatedData:
                 "Setting this to False will not have any effect."
             )
 
-        # get input realization numbers:
-        real_ids = []
-        uuids = []
-        for conf in self.source_metadata:
-            try:
-                rid = conf["fmu"]["realization"]["id"]
-                xuuid = conf["fmu"]["realization"]["uuid"]
-            except Exception as error:
-                raise ValidationError(f"Seems that input config are not valid: {error}")
-
-            real_ids.append(rid)
-            uuids.append(xuuid)
+        # get input realization numbers and uuids:
+        try:
+            realizations = [conf["fmu"]["realization"] for conf in self.source_metadata]
+            real_ids = [realization["id"] for realization in realizations]
+            uuids = [realization["uuid"] for realization in realizations]
+        except (KeyError, TypeError) as error:
+            raise InvalidMetadataError(
+                f"Seems that input config are not valid: {error}"
+            ) from error
 
         # first config file as template
         self._set_metadata(obj, real_ids, uuids, compute_md5)
@@ -362,7 +368,8 @@ class AggregatedData:
         """
         self._update_settings(kwargs)
 
-        metadata = self.generate_metadata(obj, compute_md5=True)
+        # MD5 checksum is computed from the exported file, see ExportData.export()
+        metadata = self.generate_metadata(obj, compute_md5=False)
 
         abspath = metadata["file"].get("absolute_path", None)
 
@@ -377,7 +384,9 @@ class AggregatedData:
         metafile = outfile.parent / ("." + str(outfile.name) + ".yml")
 
         logger.info("Export to file and export metadata file.")
-        _utils.export_file(obj, outfile)
+        checksum_md5 = _utils.export_file_compute_checksum_md5(obj, outfile)
+        metadata["file"]["checksum_md5"] = checksum_md5
+        self._metadata.file.checksum_md5 = checksum_md5
 
         _utils.export_metadata_file(metafile, metadata, savefmt=self.meta_format)
         logger.info("Actual file is:   %s", outfile)
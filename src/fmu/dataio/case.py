@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import copy
 import uuid
 import warnings
 from dataclasses import dataclass, field
@@ -61,7 +60,7 @@ class CreateCaseMetadata:  # pylint: disable=too-few-public-methods
     _casepath: Path = field(default_factory=Path, init=False)
 
     def __post_init__(self) -> None:
-        self._pwd = Path().absolute()
+        self._pwd = Path.cwd()
         self._casepath = Path(self.rootfolder)
         self._metafile = self._casepath / "share/metadata/fmu_case.yml"
 
@@ -97,17 +96,9 @@ class CreateCaseMetadata:  # pylint: disable=too-few-public-methods
         """
         return uuid.uuid4()
 
-    # ==================================================================================
-    # Public methods:
-    # ==================================================================================
-
-    def generate_metadata(self) -> dict:
-        """Generate case metadata.
-
-        Returns:
-            A dictionary with case metadata or an empty dictionary if the metadata
-            already exists.
-        """
+    def _generate_metadata(self) -> schema.InternalCaseMetadata | None:
+        """Generate and store the case metadata, and return the metadata model.
+        None is returned if the case metadata already exists."""
         if not self._establish_metadata_files():
             exists_warning = (
                 "The case metadata file already exists and will not be overwritten. "
@@ -116,9 +107,9 @@ class CreateCaseMetadata:  # pylint: disable=too-few-public-methods
             )
             logger.warning(exists_warning)
             warnings.warn(exists_warning, UserWarning)
-            return {}
+            return None
 
-        self._metadata = schema.InternalCaseMetadata(
+        case_metadata = schema.InternalCaseMetadata(
             masterdata=Masterdata.model_validate(self.config["masterdata"]),
             access=Access.model_validate(self.config["access"]),
             fmu=fields.FMUBase(
@@ -134,13 +125,30 @@ class CreateCaseMetadata:  # pylint: disable=too-few-public-methods
             ),
             tracklog=fields.Tracklog.initialize(),
             description=_utils.generate_description(self.description),
-        ).model_dump(
+        )
+        self._metadata = case_metadata.model_dump(
             mode="json",
             exclude_none=True,
             by_alias=True,
         )
+        return case_metadata
+
+    # ==================================================================================
+    # Public methods:
+    # ==================================================================================
+
+    def generate_metadata(self) -> dict:
+        """Generate case metadata.
+
+        Returns:
+            A dictionary with case metadata or an empty dictionary if the metadata
+            already exists.
+        """
+        if (case_metadata := self._generate_metadata()) is None:
+            return {}
 
-        return copy.deepcopy(self._metadata)
+        # dumping the model again is faster than a deepcopy of the stored dict
+        return case_metadata.model_dump(mode="json", exclude_none=True, by_alias=True)
 
     def export(self) -> str:
         """Export case metadata to file.
@@ -148,7 +156,7 @@ class CreateCaseMetadata:  # pylint: disable=too-few-public-methods
         Returns:
             Full path of metadata file.
         """
-        if self.generate_metadata():
+        if self._generate_metadata() is not None:
             _utils.export_metadata_file(
                 self._metafile, self._metadata, savefmt=self.meta_format
             )
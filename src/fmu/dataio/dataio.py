@@ -5,9 +5,12 @@ The metadata spec is documented as a JSON schema, stored under schema/.
 
 from __future__ import annotations
 
+import logging
 import os
 import warnings
+from copy import deepcopy
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import (
     TYPE_CHECKING,
@@ -27,12 +30,13 @@ if TYPE_CHECKING:
 
 from ._definitions import ValidationError
 from ._logging import null_logger
-from ._metadata import generate_export_metadata
-from ._model import enums, global_configuration
+from ._metadata import _get_meta_access, generate_export_metadata
+from ._model import enums, fields, global_configuration
 from ._model.global_configuration import GlobalConfiguration
 from ._utils import (
     detect_inside_rms,  # dataio_examples,
     export_file,
+    export_file_compute_checksum_md5,
     export_metadata_file,
     prettyprint_dict,
     read_metadata_from_file,
@@ -76,32 +80,60 @@ def _future_warning_preprocessed() -> None:
     )
 
 
+@lru_cache(maxsize=None)
+def _get_rms_rootpath(pwd: Path) -> Path:
+    """Return the rootpath when running RMS, which is two levels above the pwd.
+    Cached per pwd, as resolving symlinks can be slow on network file systems."""
+    return pwd.parent.parent.resolve()
+
+
+@lru_cache(maxsize=None)
+def _resolve_annotation(annotation: str | type) -> tuple[Any, bool]:
+    """Resolve an annotation from __annotations__ once into the type(s) to check
+    against, and a flag telling if it is a complex type where checking is skipped."""
+    # Potential issue: Eval will use the modules namespace. If given
+    #   "from typing import ClassVar" or similar.
+    # is missing from the namespace, eval(...) will fail.
+    valid_type = eval(annotation) if isinstance(annotation, str) else annotation
+
+    validcheck = getattr(valid_type, "__args__", valid_type)
+    return validcheck, "typing." in str(validcheck)
+
+
+# Cache of the settings (with annotations) that can be updated per class, derived
+# once from the dataclass signature. Annotations are only resolved when used.
+_LEGAL_SETTINGS: Final[dict[type, dict[str, str | type]]] = {}
+
+
+def _get_legal_settings(cls: type) -> dict[str, str | type]:
+    """Return the settings (with annotations) that can be updated for a class."""
+    if cls not in _LEGAL_SETTINGS:
+        annots = getattr(cls, "__annotations__", {})
+        _LEGAL_SETTINGS[cls] = {
+            key: val
+            for key, val in annots.items()
+            # config cannot be updated
+            if not key.startswith("_") and key != "config"
+        }
+    return _LEGAL_SETTINGS[cls]
+
+
 def _validate_variable(key: str, value: type, legals: dict[str, str | type]) -> bool:
     """Use data from __annotions__ to validate that overriden var. is of legal type."""
     if key not in legals:
         logger.warning("Unsupported key, raise an error")
         raise ValidationError(f"The input key '{key}' is not supported")
 
-    legal_key = legals[key]
-    # Potential issue: Eval will use the modules namespace. If given
-    #   "from typing import ClassVar" or similar.
-    # is missing from the namespace, eval(...) will fail.
-    valid_type = eval(legal_key) if isinstance(legal_key, str) else legal_key
-
-    try:
-        validcheck = valid_type.__args__
-    except AttributeError:
-        validcheck = valid_type
-
-    if "typing." not in str(validcheck):
-        if not isinstance(value, validcheck):
-            logger.warning("Wrong type of value, raise an error")
-            raise ValidationError(
-                f"The value of '{key}' is of wrong type: {type(value)}. "
-                f"Allowed types are {validcheck}"
-            )
-    else:
+    validcheck, is_complex = _resolve_annotation(legals[key])
+
+    if is_complex:
         logger.info("Skip type checking of complex types; '%s: %s'", key, validcheck)
+    elif not isinstance(value, validcheck):
+        logger.warning("Wrong type of value, raise an error")
+        raise ValidationError(
+            f"The value of '{key}' is of wrong type: {type(value)}. "
+            f"Allowed types are {validcheck}"
+        )
 
     return True
 
@@ -123,7 +155,7 @@ def read_metadata(filename: str | Path) -> dict:
     Returns:
         A dictionary with metadata read from the assiated metadata file.
     """
-    return read_metadata_from_file(filename)
+    return deepcopy(read_metadata_from_file(filename))
 
 
 # ======================================================================================
@@ -415,6 +447,8 @@ class ExportData:
     # updating state of the class also on export and generate_metadata
     _classification: enums.Classification = enums.Classification.internal
     _rep_include: bool = field(default=False, init=False)
+    # the access block is equal for all objects exported with the same settings
+    _access: fields.SsdlAccess = field(init=False)
 
     # << NB! storing ACTUAL casepath:
     _rootpath: Path = field(default_factory=Path, init=False)
@@ -422,7 +456,8 @@ class ExportData:
     def __post_init__(self) -> None:
         assert isinstance(self.config, dict)
         logger.info("Running __post_init__ ExportData")
-        logger.debug("Global config is %s", prettyprint_dict(self.config))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Global config is %s", prettyprint_dict(self.config))
 
         self._show_deprecations_or_notimplemented()
 
@@ -460,11 +495,12 @@ class ExportData:
 
         self._classification = self._get_classification()
         self._rep_include = self._get_rep_include()
+        self._access = _get_meta_access(self)
 
-        self._pwd = Path().cwd()
+        self._pwd = Path.cwd()
         self._rootpath = self._establish_rootpath()
-        logger.debug("pwd:   %s", str(self._pwd))
-        logger.info("rootpath:   %s", str(self._rootpath))
+        logger.debug("pwd:   %s", self._pwd)
+        logger.info("rootpath:   %s", self._rootpath)
 
         logger.info("Ran __post_init__")
 
@@ -571,9 +607,9 @@ class ExportData:
                 "the domain reference through the 'domain_reference' argument instead.",
                 FutureWarning,
             )
-            self.vertical_domain, self.domain_reference = list(
-                self.vertical_domain.items()
-            )[0]
+            self.vertical_domain, self.domain_reference = next(
+                iter(self.vertical_domain.items())
+            )
 
         if self.grid_model:
             warn(
@@ -733,15 +769,10 @@ class ExportData:
         )
         logger.info("Try new settings %s", newsettings)
 
-        # derive legal input from dataclass signature
-        annots = getattr(self, "__annotations__", {})
-        legals = {key: val for key, val in annots.items() if not key.startswith("_")}
-        if "config" in legals:
-            del legals["config"]  # config cannot be updated
-
         if "config" in newsettings:
             raise ValueError("Cannot have 'config' outside instance initialization")
 
+        legals = _get_legal_settings(type(self))
         for setting, value in newsettings.items():
             if _validate_variable(setting, value, legals):
                 setattr(self, setting, value)
@@ -753,6 +784,7 @@ class ExportData:
 
         self._classification = self._get_classification()
         self._rep_include = self._get_rep_include()
+        self._access = _get_meta_access(self)
 
     def _establish_rootpath(self) -> Path:
         """
@@ -783,7 +815,7 @@ class ExportData:
         if ExportData._inside_rms or INSIDE_RMS:
             logger.info("Run from inside RMS")
             ExportData._inside_rms = True
-            return self._pwd.parent.parent.absolute().resolve()
+            return _get_rms_rootpath(self._pwd)
 
         logger.info(
             "Running outside FMU context or casepath with valid case metadata "
@@ -927,11 +959,15 @@ class ExportData:
             self._update_check_settings(kwargs)
             return self._export_without_metadata(obj)
 
-        metadata = self.generate_metadata(obj, compute_md5=True, **kwargs)
+        # the MD5 checksum is computed from the exported file itself, which avoids
+        # an additional export of the object to a temporary file
+        metadata = self.generate_metadata(obj, compute_md5=False, **kwargs)
         outfile = Path(metadata["file"]["absolute_path"])
         metafile = outfile.parent / f".{outfile.name}.yml"
 
-        export_file(obj, outfile, fmt=metadata["data"].get("format", ""))
+        metadata["file"]["checksum_md5"] = export_file_compute_checksum_md5(
+            obj, outfile, fmt=metadata["data"].get("format", "")
+        )
         logger.info("Actual file is:   %s", outfile)
 
         export_metadata_file(metafile, metadata, savefmt=self.meta_format)
@@ -2,18 +2,18 @@ from __future__ import annotations
 
 import shutil
 import warnings
+from copy import deepcopy
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Final
 
-import yaml
 from pydantic import ValidationError
 
 from ._logging import null_logger
 from ._model import enums, schema
 from ._model.enums import FMUContext
 from ._model.fields import File
-from ._utils import export_metadata_file, md5sum
+from ._utils import export_metadata_file, md5sum, yaml_load_cached
 from .exceptions import InvalidMetadataError
 from .providers._filedata import ShareFolder
 from .providers._fmu import (
@@ -111,10 +111,12 @@ class ExportPreprocessedData:
         Return a metadata file as a dictionary. If the metadata file
         is not present, None will be returned.
         """
-        if objmetafile.exists():
-            with open(objmetafile, encoding="utf-8") as stream:
-                return yaml.safe_load(stream)
-        return None
+        try:
+            meta = yaml_load_cached(objmetafile)
+        except FileNotFoundError:
+            return None
+        # the cached dict is shared between calls, hence return a copy
+        return deepcopy(meta) if isinstance(meta, dict) else None
 
     def _get_relative_export_path(self, existing_path: Path) -> Path:
         """
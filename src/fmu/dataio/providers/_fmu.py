@@ -36,7 +36,6 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Final, Optional, Union
 from warnings import warn
 
-from fmu.config import utilities as ut
 from fmu.dataio import _utils
 from fmu.dataio._logging import null_logger
 from fmu.dataio._model import fields, schema
@@ -263,7 +262,7 @@ class FmuProvider(Provider):
             return None
 
         restart_metadata = schema.InternalCaseMetadata.model_validate(
-            ut.yaml_load(restart_case_metafile, loader="standard")
+            _utils.yaml_load_cached(restart_case_metafile)
         )
         return _utils.uuid_from_string(
             f"{restart_metadata.fmu.case.uuid}{restart_path.name}"
@@ -294,7 +293,7 @@ class FmuProvider(Provider):
         assert self._casepath is not None
         case_metafile = self._casepath / ERT_RELATIVE_CASE_METADATA_FILE
         return schema.InternalCaseMetadata.model_validate(
-            ut.yaml_load(case_metafile, loader="standard")
+            _utils.yaml_load_cached(case_metafile)
         )
 
     def _get_realization_meta(self, real_uuid: UUID) -> fields.Realization:
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 from abc import abstractmethod
-from copy import deepcopy
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, Final
@@ -19,7 +18,11 @@ from fmu.dataio._model.global_configuration import (
     GlobalConfiguration,
     StratigraphyElement,
 )
-from fmu.dataio._model.schema import AllowedContent, InternalAnyData
+from fmu.dataio._model.schema import (
+    CONTENTS_REQUIRE_SPECIFIC,
+    AllowedContent,
+    InternalAnyData,
+)
 from fmu.dataio._utils import generate_description
 from fmu.dataio.providers._base import Provider
 
@@ -164,20 +167,23 @@ class ObjectDataProvider(Provider):
     def _get_validated_content(self, content: str | dict | None) -> AllowedContent:
         """Check content and return a validated model."""
         logger.info("Evaluate content")
-        logger.debug("content is %s of type %s", str(content), type(content))
+        logger.debug("content is %s of type %s", content, type(content))
 
         if not content:
             return AllowedContent(content="unset")
 
         if isinstance(content, str):
-            return AllowedContent(content=Content(content))
+            usecontent = Content(content)
+            if usecontent in CONTENTS_REQUIRE_SPECIFIC:
+                # validate to raise (or warn) on the missing content specific input
+                return AllowedContent(content=usecontent)
+            return AllowedContent.model_construct(content=usecontent)
 
         if len(content) > 1:
             raise ValueError(
                 "Found more than one content item in the 'content' dictionary. Ensure "
                 "input is formatted as content={'mycontent': {extra_key: extra_value}}."
             )
-        content = deepcopy(content)
         usecontent, content_specific = next(iter(content.items()))
         logger.debug("usecontent is %s", usecontent)
         logger.debug("content_specific is %s", content_specific)
@@ -6,7 +6,7 @@ from copy import deepcopy
 import pytest
 from pydantic import ValidationError
 
-from fmu.dataio._model import Root, data
+from fmu.dataio._model import Root, data, fields
 
 from ..utils import _metadata_examples
 
@@ -464,3 +464,21 @@ def test_realization(metadata_examples):
 
     with pytest.raises(ValidationError):
         Root.model_validate(_example)
+
+
+def test_parameters_value_types():
+    """Scalar parameter values shall keep their type, and dicts shall nest."""
+    parameters = fields.Parameters.model_validate(
+        {"p1": 42, "p2": 42.3, "p3": "42", "p4": {"p4_1": 1, "p4_2": "nested"}}
+    )
+
+    assert type(parameters["p1"]) is int
+    assert type(parameters["p2"]) is float
+    assert type(parameters["p3"]) is str
+    assert isinstance(parameters["p4"], fields.Parameters)
+    assert parameters.model_dump() == {
+        "p1": 42,
+        "p2": 42.3,
+        "p3": "42",
+        "p4": {"p4_1": 1, "p4_2": "nested"},
+    }
@@ -15,3 +15,10 @@ def test_schema_uptodate():
     """
     with open("schema/definitions/0.8.0/schema/fmu_results.json") as f:
         assert json.load(f) == dump()
+
+
+def test_dump_returns_independent_copies():
+    """The schema is generated once, but modifying a dump shall not affect others."""
+    schema = dump()
+    schema["$defs"].clear()
+    assert dump()["$defs"]
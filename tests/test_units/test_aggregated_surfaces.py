@@ -2,12 +2,15 @@
 
 import logging
 import os
+from copy import deepcopy
+from pathlib import Path
 
 import pytest
 import xtgeo
 
 import fmu.dataio._utils as utils
 import fmu.dataio.dataio as dataio
+from fmu.dataio.exceptions import InvalidMetadataError
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +38,46 @@ def test_regsurf_aggregated(fmurun_w_casemetadata, aggr_surfs_mean):
     assert newmeta["fmu"]["context"]["stage"] == "iteration"
 
 
+def test_regsurf_aggregated_source_metadata_not_modified(
+    fmurun_w_casemetadata, aggr_surfs_mean
+):
+    """Test that the input metadata used as template are left untouched."""
+    os.chdir(fmurun_w_casemetadata)
+
+    aggr_mean, metas = aggr_surfs_mean
+    metas_original = deepcopy(metas)
+
+    aggdata = dataio.AggregatedData(
+        source_metadata=metas,
+        operation="mean",
+        name="myaggrd",
+        tagname="mytag",
+    )
+    aggdata.generate_metadata(aggr_mean)
+
+    assert metas == metas_original
+
+
+def test_regsurf_aggregated_source_metadata_without_realization(
+    fmurun_w_casemetadata, aggr_surfs_mean
+):
+    """Test that source metadata without a realization block is reported."""
+    os.chdir(fmurun_w_casemetadata)
+
+    aggr_mean, metas = aggr_surfs_mean
+    metas = deepcopy(metas)
+    del metas[1]["fmu"]["realization"]
+
+    aggdata = dataio.AggregatedData(
+        source_metadata=metas,
+        operation="mean",
+        name="myaggrd",
+        tagname="mytag",
+    )
+    with pytest.raises(InvalidMetadataError, match="input config are not valid"):
+        aggdata.generate_metadata(aggr_mean)
+
+
 def test_regsurf_aggregated_content_seismic(
     fmurun_w_casemetadata, aggr_sesimic_surfs_mean
 ):
@@ -99,6 +142,10 @@ def test_regsurf_aggregated_export(fmurun_w_casemetadata, aggr_surfs_mean):
 
     assert "iter-0/share/results/maps/myaggrd--mean.gri" in mypath
 
+    # the checksum_md5 in the metadata shall match the exported file
+    metadata = dataio.read_metadata(mypath)
+    assert metadata["file"]["checksum_md5"] == utils.md5sum(Path(mypath))
+
 
 def test_regsurf_aggregated_alt_keys(fmurun_w_casemetadata, aggr_surfs_mean):
     """Test generating aggragated metadata, putting keys in export instead."""
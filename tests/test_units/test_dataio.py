@@ -11,9 +11,10 @@ import pydantic
 import pytest
 import yaml
 
+from fmu.dataio import dataio
 from fmu.dataio._model.enums import FMUContext
-from fmu.dataio._utils import prettyprint_dict
-from fmu.dataio.dataio import ExportData, read_metadata
+from fmu.dataio._utils import md5sum, prettyprint_dict
+from fmu.dataio.dataio import ExportData, _get_legal_settings, read_metadata
 from fmu.dataio.providers._fmu import FmuEnv
 
 # pylint: disable=no-member
@@ -248,6 +249,36 @@ def test_update_check_settings_shall_fail(globalconfig1):
         some._update_check_settings(newsettings)
 
 
+def test_update_check_settings_config_not_legal(globalconfig1):
+    assert "config" not in _get_legal_settings(ExportData)
+
+    some = ExportData(config=globalconfig1, content="depth")
+    with pytest.warns(FutureWarning), pytest.raises(ValueError, match="'config'"):
+        some._update_check_settings({"config": globalconfig1})
+
+
+def test_update_check_settings_resolves_only_given_keys(
+    monkeypatch, globalconfig1, regsurf
+):
+    """Only the annotations of the settings given are resolved, as e.g. the
+    'X | Y' annotations cannot be evaluated on python < 3.10."""
+    resolved = []
+    resolve_annotation = dataio._resolve_annotation
+
+    def _record_resolve_annotation(annotation):
+        resolved.append(annotation)
+        return resolve_annotation(annotation)
+
+    monkeypatch.setattr(dataio, "_resolve_annotation", _record_resolve_annotation)
+
+    edata = ExportData(config=globalconfig1, content="depth")
+    with pytest.warns(FutureWarning):
+        meta = edata.generate_metadata(regsurf, name="kwargname")
+
+    assert meta["data"]["name"] == "kwargname"
+    assert resolved == [ExportData.__annotations__["name"]]
+
+
 @pytest.mark.parametrize(
     "key, value, expected_msg",
     [
@@ -565,6 +596,29 @@ def test_content_deprecated_seismic_offset(regsurf, globalconfig2):
     }
 
 
+def test_export_checksum_md5_of_exported_file(
+    monkeypatch, tmp_path, regsurf, globalconfig2
+):
+    """The checksum_md5 in the metadata shall match the exported file."""
+    monkeypatch.chdir(tmp_path)
+    out = ExportData(config=globalconfig2, name="mymap", content="depth").export(
+        regsurf
+    )
+    assert read_metadata(out)["file"]["checksum_md5"] == md5sum(Path(out))
+
+
+def test_content_dict_input_not_modified(regsurf, globalconfig2):
+    """Assert that the input content dict is left untouched by the validation."""
+    content = {"seismic": {"offset": "0-15"}}
+    eobj = ExportData(config=globalconfig2, name="TopVolantis", content=content)
+
+    with pytest.warns(DeprecationWarning, match="seismic.offset is deprecated"):
+        mymeta = eobj.generate_metadata(regsurf)
+
+    assert content == {"seismic": {"offset": "0-15"}}
+    assert mymeta["data"]["seismic"] == {"stacking_offset": "0-15"}
+
+
 @pytest.mark.filterwarnings("ignore: Number of maps nodes are 0")
 def test_surfaces_with_non_finite_values(
     globalconfig1, regsurf_masked_only, regsurf_nan_only, regsurf
@@ -657,6 +711,15 @@ def test_vertical_domain(regsurf, globalconfig1):
         ExportData(
             config=globalconfig1, vertical_domain={"invalid": 5}, content="thickness"
         ).generate_metadata(regsurf)
+    # only the first item of the deprecated dict input is used
+    with pytest.warns(FutureWarning, match="deprecated"):
+        edata = ExportData(
+            config=globalconfig1,
+            vertical_domain={"time": "sb", "depth": "msl"},
+            content="thickness",
+        )
+    assert edata.vertical_domain == "time"
+    assert edata.domain_reference == "sb"
 
 
 def test_vertical_domain_vs_depth_time_content(regsurf, globalconfig1):
@@ -123,6 +123,10 @@ def test_create_case_metadata_generate_metadata(monkeypatch, fmurun, globalconfi
     assert metadata["fmu"]["case"]["name"] == "mycase"
     assert metadata["fmu"]["case"]["user"]["id"] == "user"
 
+    # the returned metadata shall not share any data with the stored metadata
+    metadata["fmu"]["case"]["name"] = "modified"
+    assert icase._metadata["fmu"]["case"]["name"] == "mycase"
+
 
 def test_create_case_metadata_generate_metadata_warn_if_exists(
     monkeypatch, fmurun_w_casemetadata, globalconfig2
@@ -21,75 +21,76 @@ from ..utils import inside_rms
 # --------------------------------------------------------------------------------------
 
 
-def test_objectdata_regularsurface_derive_named_stratigraphy(regsurf, edataobj1):
+@pytest.fixture(name="regsurf_provider1", scope="module")
+def fixture_regsurf_provider1(regsurf, edataobj1):
+    """Objectdata provider for regsurf and edataobj1, shared within the module."""
+    return objectdata_provider_factory(regsurf, edataobj1)
+
+
+@pytest.fixture(name="regsurf_provider2", scope="function")
+def fixture_regsurf_provider2(regsurf, edataobj2):
+    """Objectdata provider for regsurf and edataobj2."""
+    return objectdata_provider_factory(regsurf, edataobj2)
+
+
+def test_objectdata_regularsurface_derive_named_stratigraphy(regsurf_provider1):
     """Get name and some stratigaphic keys for a valid RegularSurface object ."""
     # mimic the stripped parts of configuations for testing here
-    objdata = objectdata_provider_factory(regsurf, edataobj1)
-
-    res = objdata._get_stratigraphy_element()
+    res = regsurf_provider1._get_stratigraphy_element()
 
     assert res.name == "Whatever Top"
     assert "TopWhatever" in res.alias
     assert res.stratigraphic is True
 
 
-def test_objectdata_regularsurface_get_stratigraphy_element_differ(regsurf, edataobj2):
+def test_objectdata_regularsurface_get_stratigraphy_element_differ(regsurf_provider2):
     """Get name and some stratigaphic keys for a valid RegularSurface object ."""
     # mimic the stripped parts of configuations for testing here
-    objdata = objectdata_provider_factory(regsurf, edataobj2)
-
-    res = objdata._get_stratigraphy_element()
+    res = regsurf_provider2._get_stratigraphy_element()
 
     assert res.name == "VOLANTIS GP. Top"
     assert "TopVolantis" in res.alias
     assert res.stratigraphic is True
 
 
-def test_objectdata_regularsurface_validate_extension(regsurf, edataobj1):
+def test_objectdata_regularsurface_validate_extension(regsurf_provider1):
     """Test a valid extension for RegularSurface object."""
 
-    ext = objectdata_provider_factory(regsurf, edataobj1)._validate_get_ext(
-        "irap_binary", ValidFormats.surface
-    )
+    ext = regsurf_provider1._validate_get_ext("irap_binary", ValidFormats.surface)
 
     assert ext == ".gri"
 
 
-def test_objectdata_regularsurface_validate_extension_shall_fail(regsurf, edataobj1):
+def test_objectdata_regularsurface_validate_extension_shall_fail(regsurf_provider1):
     """Test an invalid extension for RegularSurface object."""
 
     with pytest.raises(ConfigurationError):
-        objectdata_provider_factory(regsurf, edataobj1)._validate_get_ext(
-            "some_invalid", ValidFormats.surface
-        )
+        regsurf_provider1._validate_get_ext("some_invalid", ValidFormats.surface)
 
 
-def test_objectdata_regularsurface_spec_bbox(regsurf, edataobj1):
+def test_objectdata_regularsurface_spec_bbox(regsurf, regsurf_provider1):
     """Derive specs and bbox for RegularSurface object."""
 
-    objdata = objectdata_provider_factory(regsurf, edataobj1)
-    specs = objdata.get_spec()
-    bbox = objdata.get_bbox()
+    specs = regsurf_provider1.get_spec()
+    bbox = regsurf_provider1.get_bbox()
 
     assert specs.ncol == regsurf.ncol
     assert bbox.xmin == 0.0
     assert bbox.zmin == 1234.0
 
 
-def test_objectdata_regularsurface_derive_objectdata(regsurf, edataobj1):
+def test_objectdata_regularsurface_derive_objectdata(regsurf_provider1):
     """Derive other properties."""
 
-    objdata = objectdata_provider_factory(regsurf, edataobj1)
-    assert isinstance(objdata, RegularSurfaceDataProvider)
-    assert objdata.classname.value == "surface"
-    assert objdata.extension == ".gri"
+    assert isinstance(regsurf_provider1, RegularSurfaceDataProvider)
+    assert regsurf_provider1.classname.value == "surface"
+    assert regsurf_provider1.extension == ".gri"
 
 
-def test_objectdata_regularsurface_derive_metadata(regsurf, edataobj1):
+def test_objectdata_regularsurface_derive_metadata(regsurf_provider1):
     """Derive all metadata for the 'data' block in fmu-dataio."""
 
-    myobj = objectdata_provider_factory(regsurf, edataobj1)
-    metadata = myobj.get_metadata()
+    metadata = regsurf_provider1.get_metadata()
     assert metadata.root.content == "depth"
     assert metadata.root.alias
 
@@ -175,6 +175,31 @@ def test_export_without_existing_meta(
     assert filepath.startswith(str(fmurun_prehook))
 
 
+def test_export_with_empty_existing_meta(
+    fmurun_prehook, rmsglobalconfig, regsurf, monkeypatch
+):
+    """
+    Test that an empty metadata file is treated as missing metadata
+    """
+    # mock being outside of FMU and export preprocessed surface
+    remove_ert_env(monkeypatch)
+    surfacepath, metafile = export_preprocessed_surface(rmsglobalconfig, regsurf)
+
+    # run the re-export of the preprocessed data inside an mocked FMU run
+    set_ert_env_prehook(monkeypatch)
+
+    # empty the metafile
+    metafile.write_text("")
+    edata = dataio.ExportPreprocessedData(is_observation=True, casepath=fmurun_prehook)
+    with pytest.raises(RuntimeError, match="Could not detect existing metadata"):
+        edata.generate_metadata(surfacepath)
+
+    with pytest.warns(UserWarning, match="Could not detect existing metadata"):
+        filepath = edata.export(surfacepath)
+
+    assert Path(filepath).exists()
+
+
 def test_preprocessed_surface_modified_post_export(
     fmurun_prehook, rmsglobalconfig, regsurf, monkeypatch
 ):
@@ -103,6 +103,19 @@ def test_non_metadata_export_metadata_file():
         utils.export_metadata_file(Path(tf.name), {}, savefmt="yaml")
 
 
+def test_export_metadata_file_yaml_keeps_order(tmp_path):
+    metadata = {"version": "0.8.0", "class": "surface", "data": {"name": "æøå"}}
+    metafile = tmp_path / ".surface.gri.yml"
+    utils.export_metadata_file(metafile, metadata, savefmt="yaml")
+
+    assert metafile.read_text(encoding="utf8").splitlines() == [
+        "version: 0.8.0",
+        "class: surface",
+        "data:",
+        "  name: æøå",
+    ]
+
+
 def test_export_file_raises():
     with NamedTemporaryFile() as tf, pytest.raises(TypeError):
         utils.export_file(
@@ -148,3 +161,28 @@ def test_read_named_envvar():
 
     os.environ["MYTESTENV"] = "mytestvalue"
     assert utils.read_named_envvar("MYTESTENV") == "mytestvalue"
+
+
+def test_yaml_load_cached(tmp_path):
+    yamlfile = tmp_path / "file.yml"
+    yamlfile.write_text("key: value\n")
+
+    first = utils.yaml_load_cached(yamlfile)
+    assert first == {"key": "value"}
+    assert utils.yaml_load_cached(str(yamlfile)) is first
+
+    # a modified file shall be re-read
+    yamlfile.write_text("key: othervalue\n")
+    assert utils.yaml_load_cached(yamlfile) == {"key": "othervalue"}
+
+
+def test_some_config_from_env_rereads_included_files(tmp_path, monkeypatch):
+    """Changes in a file included by the global config shall be picked up."""
+    (tmp_path / "main.yml").write_text("sub: !include sub.yml\n")
+    (tmp_path / "sub.yml").write_text("x: 1\n")
+    monkeypatch.setenv("FMU_GLOBAL_CONFIG", str(tmp_path / "main.yml"))
+    monkeypatch.chdir(tmp_path)
+    assert utils.some_config_from_env() == {"sub": {"x": 1}}
+
+    (tmp_path / "sub.yml").write_text("x: 2\n")
+    assert utils.some_config_from_env() == {"sub": {"x": 2}}